@@ -4,9 +4,13 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import SinumAPI
-from .const import DOMAIN
+from .const import CONF_LOGIN_URL, DOMAIN
+from .coordinator import SinumDataUpdateCoordinator
+from .exceptions import CannotConnect, InvalidAuth
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
 
@@ -16,20 +20,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     
     # Create API instance
+    # Local Sinum installations use self-signed certificates, so share HA's
+    # unverified session pool instead of owning a private connector
     api = SinumAPI(
+        session=async_get_clientsession(hass, verify_ssl=False),
         host=entry.data["host"],
         username=entry.data["username"],
         password=entry.data["password"],
+        login_url=entry.data.get(CONF_LOGIN_URL),
     )
     
     # Test connection
     try:
         await api.async_test_connection()
-    except Exception as err:
-        raise Exception(f"Failed to connect to Sinum: {err}") from err
+    except InvalidAuth as err:
+        raise ConfigEntryAuthFailed(f"Invalid Sinum credentials: {err}") from err
+    except CannotConnect as err:
+        # Let Home Assistant retry setup with its own backoff
+        raise ConfigEntryNotReady(f"Failed to connect to Sinum: {err}") from err
     
-    # Store API instance
-    hass.data[DOMAIN][entry.entry_id] = api
+    # Remember the working login endpoint so later setups skip probing
+    if api.login_url and api.login_url != entry.data.get(CONF_LOGIN_URL):
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_LOGIN_URL: api.login_url}
+        )
+    
+    # One coordinator shared by all platforms, so each poll hits the API once
+    coordinator = SinumDataUpdateCoordinator(hass, api)
+    await coordinator.async_config_entry_first_refresh()
+    
+    hass.data[DOMAIN][entry.entry_id] = {"api": api, "coordinator": coordinator}
     
     # Forward the setup to the sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -1,38 +1,128 @@
 """API client for Sinum."""
 from __future__ import annotations
 
+import asyncio
+import base64
+from collections.abc import Awaitable, Callable
 import logging
-from typing import Any
+import random
+import time
+from typing import Any, TypeVar
 
 import aiohttp
 
+from homeassistant.util.json import json_loads
+
 from .exceptions import CannotConnect, InvalidAuth
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Shared by all requests; a short connect timeout makes a wrong host fail fast
+_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=5)
+
+# Candidate login endpoints, starting with the correct one according to API docs
+_LOGIN_PATHS = ("/api/v1/login", "/auth/login", "/api/auth/login", "/login")
+
+# Response fields that may carry the auth token, in order of preference:
+# first inside the "data" object (Sinum API format: data.session), then top level
+_DATA_TOKEN_KEYS = ("session", "access_token")
+_TOKEN_KEYS = ("token", "access_token", "accessToken", "auth_token")
+
+# Token lifetime when the login response doesn't say, and the shortest one we accept
+_DEFAULT_TOKEN_TTL = 3600.0  # seconds
+_MIN_TOKEN_TTL = 60.0  # seconds
+
+# Retry tuning for transient network errors
+_AUTH_MAX_ATTEMPTS = 2
+_DATA_MAX_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.5  # seconds
+_RETRY_MAX_DELAY = 5.0  # seconds
+
+
+class _ServerError(CannotConnect):
+    """Error to indicate a transient 5xx response from the API."""
+
+
+async def _async_retry(
+    func: Callable[[], Awaitable[_T]],
+    max_attempts: int,
+    retry_on: tuple[type[BaseException], ...],
+) -> _T:
+    """Call func, retrying on the given errors with exponential backoff and jitter."""
+    for attempt in range(max_attempts - 1):
+        try:
+            return await func()
+        except retry_on as err:
+            delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2**attempt) * random.uniform(0.5, 1.5)
+            _LOGGER.debug("Transient error (%s), retrying in %.1f s", err, delay)
+            await asyncio.sleep(delay)
+    return await func()
+
+
+def _parse_jwt_payload(token: str) -> dict[str, Any]:
+    """Decode the (unverified) payload of a JWT, or return {} if it is not one."""
+    token_parts = token.split(".", 2)
+    if len(token_parts) < 2:
+        return {}
+    
+    # Restore the base64 padding that JWTs strip
+    payload_b64 = token_parts[1]
+    payload_b64 += "=" * (-len(payload_b64) % 4)
+    
+    try:
+        payload = json_loads(base64.urlsafe_b64decode(payload_b64))
+    except ValueError as err:  # also covers binascii.Error and JSON decode errors
+        _LOGGER.debug("Could not parse token expiration: %s", err)
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _token_ttl(expires_at: Any, expires_in: Any) -> float:
+    """Return the token lifetime in seconds, falling back to one hour."""
+    try:
+        if expires_at:
+            ttl = float(expires_at) - time.time()
+        elif expires_in:
+            ttl = float(expires_in)
+        else:
+            ttl = _DEFAULT_TOKEN_TTL
+    except (TypeError, ValueError) as err:
+        _LOGGER.debug("Could not use token expiration %r/%r: %s", expires_at, expires_in, err)
+        ttl = _DEFAULT_TOKEN_TTL
+    # A controller clock ahead of ours must not make every request log in again
+    return ttl if ttl >= _MIN_TOKEN_TTL else _MIN_TOKEN_TTL
+
 
 class SinumAPI:
     """API client for Sinum."""
 
-    def __init__(self, host: str, username: str, password: str) -> None:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        host: str,
+        username: str,
+        password: str,
+        login_url: str | None = None,
+    ) -> None:
         """Initialize the API client."""
         self.host = host.rstrip("/")
         self.username = username
         self.password = password
-        self._session: aiohttp.ClientSession | None = None
+        self._session = session
+        self._login_urls = tuple(self.host + path for path in _LOGIN_PATHS)
+        self._rooms_url = f"{self.host}/api/v1/rooms"
+        self._devices_url = f"{self.host}/api/v1/devices"
+        self._sbus_devices_url = f"{self.host}/api/v1/devices?class=sbus"
+        self._virtual_devices_url = f"{self.host}/api/v1/devices?class=virtual"
+        self._login_url = login_url  # Login endpoint that worked last time
         self._auth_token: str | None = None
-        self._token_expires_at: float | None = None  # Timestamp when token expires
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None:
-            # Create SSL context that allows self-signed certificates
-            # This is needed for local Sinum installations
-            ssl_context = False  # Will disable SSL verification for local dev
-            # For production, you might want to use: ssl_context = ssl.create_default_context()
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            self._session = aiohttp.ClientSession(connector=connector)
-        return self._session
+        self._headers: dict[str, str] = {}  # Request headers for the current token
+        self._auth_lock = asyncio.Lock()
+        self._devices_combined: bool | None = None  # None until detected
+        self._probe_response: Any = None  # Devices fetched by the combined endpoint check
+        self._token_expires_at: float | None = None  # Monotonic time when token should be refreshed
 
     async def async_authenticate(self) -> None:
         """Authenticate with Sinum API.
@@ -40,349 +130,357 @@ class SinumAPI:
         According to Sinum API documentation:
         POST /auth/login with username and password
         Returns token in response.
+        
+        Connection failures are retried with backoff; invalid credentials
+        fail immediately.
         """
-        session = await self._get_session()
+        await _async_retry(self._async_login, _AUTH_MAX_ATTEMPTS, (CannotConnect,))
+
+    async def _async_login(self) -> None:
+        """Try the candidate login endpoints once."""
+        session = self._session
         
-        # Try different possible endpoints (starting with correct one)
-        possible_endpoints = [
-            f"{self.host}/api/v1/login",  # Correct endpoint according to API docs
-            f"{self.host}/auth/login",
-            f"{self.host}/api/auth/login",
-            f"{self.host}/login",
-        ]
+        # Once an endpoint has worked, try it first; the other candidates
+        # are probed only if it turns out to be gone
+        possible_endpoints = self._login_urls
+        if self._login_url:
+            possible_endpoints = (self._login_url,) + tuple(
+                url for url in self._login_urls if url != self._login_url
+            )
         
         last_error = None
         
         for auth_url in possible_endpoints:
-            _LOGGER.debug("Trying authentication endpoint: %s", auth_url)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Trying authentication endpoint: %s", auth_url)
             
             try:
                 # Try JSON first
                 async with session.post(
                     auth_url,
                     json={"username": self.username, "password": self.password},
-                    timeout=aiohttp.ClientTimeout(total=10),
+                    timeout=_TIMEOUT,
                 ) as response:
-                    response_text = await response.text()
-                    _LOGGER.debug("Response status: %s, body: %s", response.status, response_text[:200])
+                    # Read the body once; decode it only where it is logged
+                    raw = await response.read()
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Response status: %s, body: %s", response.status, raw[:200].decode("utf-8", "replace"))
                     
                     if response.status == 200:
                         try:
-                            data = await response.json()
-                        except Exception:
+                            data = json_loads(raw) if raw else {}
+                        except ValueError:
                             # If response is not JSON, try to parse as text
-                            data = {"token": response_text.strip() if response_text.strip() else None}
+                            data = {"token": raw.decode("utf-8", "replace").strip() or None}
+                        if not isinstance(data, dict):
+                            data = {}
                         
                         # Try different possible token field names
                         # Sinum API returns token in data.session
                         data_obj = data.get("data", {}) if isinstance(data.get("data"), dict) else {}
-                        self._auth_token = (
-                            data_obj.get("session")  # Sinum API format: data.session
-                            or data_obj.get("access_token")
-                            or data.get("token")
-                            or data.get("access_token")
-                            or data.get("accessToken")
-                            or data.get("auth_token")
-                        )
+                        self._auth_token = None
+                        for source, keys in ((data_obj, _DATA_TOKEN_KEYS), (data, _TOKEN_KEYS)):
+                            for key in keys:
+                                token = source.get(key)
+                                if isinstance(token, str) and token:
+                                    self._auth_token = token
+                                    break
+                            if self._auth_token:
+                                break
                         
                         if self._auth_token:
-                            # Parse token expiration time from JWT payload
-                            try:
-                                import base64
-                                import json as json_lib
-                                import time
-                                
-                                # Decode JWT token to get expiration
-                                token_parts = self._auth_token.split(".")
-                                if len(token_parts) >= 2:
-                                    # Decode payload (add padding if needed)
-                                    payload_b64 = token_parts[1]
-                                    padding = 4 - len(payload_b64) % 4
-                                    if padding != 4:
-                                        payload_b64 += "=" * padding
-                                    
-                                    payload = json_lib.loads(
-                                        base64.urlsafe_b64decode(payload_b64).decode()
-                                    )
-                                    
-                                    # Get expiration time
-                                    expires_at = payload.get("expires_at")
-                                    expires_in = payload.get("expires_in", 3600)
-                                    
-                                    if expires_at:
-                                        # expires_at is Unix timestamp
-                                        # Set expiration 5 minutes before actual expiration for safety
-                                        self._token_expires_at = expires_at - 300
-                                    elif expires_in:
-                                        # expires_in is seconds until expiration
-                                        self._token_expires_at = time.time() + expires_in - 300
-                                    else:
-                                        # Default: assume 1 hour expiration, refresh after 55 minutes
-                                        self._token_expires_at = time.time() + 3300
-                                    
-                                    _LOGGER.debug("Token expires at: %s", self._token_expires_at)
-                            except Exception as err:
-                                _LOGGER.debug("Could not parse token expiration: %s", err)
-                                # Default: assume 1 hour expiration, refresh after 55 minutes
-                                import time
-                                self._token_expires_at = time.time() + 3300
+                            # Token lifetime may be given in the response itself
+                            # or in the JWT payload (expires_at / exp are Unix timestamps)
+                            payload = _parse_jwt_payload(self._auth_token)
+                            expires_at = payload.get("expires_at") or payload.get("exp")
+                            expires_in = (
+                                data_obj.get("expires_in")
+                                or data.get("expires_in")
+                                or payload.get("expires_in")
+                            )
+
+                            ttl = _token_ttl(expires_at, expires_in)
+
+                            # Refresh 5 minutes before actual expiration for safety
+                            # (or halfway through for very short-lived tokens).
+                            # Monotonic clock so wall-clock jumps don't expire the token.
+                            self._token_expires_at = time.monotonic() + ttl - min(300.0, ttl / 2)
+                            _LOGGER.debug("Token valid for %.0f seconds", ttl)
                             
+                            self._headers = {
+                                "Authorization": self._auth_token,  # Sinum API uses token directly, not "Bearer {token}"
+                                "Content-Type": "application/json",
+                            }
+                            self._login_url = auth_url
                             _LOGGER.info("Successfully authenticated with endpoint: %s", auth_url)
                             return
                         else:
                             _LOGGER.warning("No token in response from %s: %s", auth_url, data)
-                            last_error = InvalidAuth(f"No token in response: {response_text[:100]}")
+                            last_error = CannotConnect(f"No token in response: {raw[:100].decode('utf-8', 'replace')}")
+                            if auth_url == self._login_url:
+                                break
                     elif response.status == 401:
-                        _LOGGER.error("Invalid credentials for endpoint %s: %s", auth_url, response_text[:200])
+                        _LOGGER.error("Invalid credentials for endpoint %s: %s", auth_url, raw[:200].decode("utf-8", "replace"))
                         raise InvalidAuth("Invalid credentials - check username and password")
                     elif response.status == 404:
-                        # Endpoint not found, try next one
-                        _LOGGER.debug("Endpoint %s not found (404), trying next...", auth_url)
+                        if auth_url == self._login_url:
+                            # Remembered endpoint is gone (e.g. after a firmware update)
+                            _LOGGER.info("Login endpoint %s not found (404), rediscovering...", auth_url)
+                            self._login_url = None
+                        else:
+                            # Endpoint not found, try next one
+                            _LOGGER.debug("Endpoint %s not found (404), trying next...", auth_url)
                         continue
                     else:
-                        _LOGGER.warning("Unexpected status %s from %s: %s", response.status, auth_url, response_text[:200])
-                        last_error = InvalidAuth(f"Authentication failed: {response.status} - {response_text[:100]}")
+                        response_text = raw[:200].decode("utf-8", "replace")
+                        _LOGGER.warning("Unexpected status %s from %s: %s", response.status, auth_url, response_text)
+                        # Only a 401 means bad credentials; anything else is
+                        # treated as a (possibly transient) API problem
+                        if response.status >= 500:
+                            last_error = _ServerError(f"Authentication failed: {response.status} - {response_text[:100]}")
+                        else:
+                            last_error = CannotConnect(f"Authentication failed: {response.status} - {response_text[:100]}")
+                        if auth_url == self._login_url:
+                            # The remembered endpoint exists; other paths won't help
+                            break
                         
             except aiohttp.ClientConnectorError as err:
+                # All endpoints live on the same host, so probing the rest is pointless
                 _LOGGER.debug("Connection error to %s: %s", auth_url, err)
-                last_error = CannotConnect(f"Cannot connect to Sinum API at {auth_url}: {err}")
-                continue
+                raise CannotConnect(f"Cannot connect to Sinum API at {auth_url}: {err}") from err
+            except asyncio.TimeoutError as err:
+                # Same host for every endpoint; leave retrying to async_authenticate.
+                # Also covers aiohttp.ServerTimeoutError, which is a ClientError too.
+                _LOGGER.debug("Timeout connecting to %s", auth_url)
+                raise CannotConnect(f"Timeout connecting to {auth_url}") from err
             except aiohttp.ClientError as err:
                 _LOGGER.debug("HTTP error to %s: %s", auth_url, err)
                 last_error = CannotConnect(f"Connection error to {auth_url}: {err}")
                 continue
-            except InvalidAuth:
-                # Re-raise InvalidAuth immediately
-                raise
-            except Exception as err:
-                _LOGGER.debug("Unexpected error with %s: %s", auth_url, err)
-                last_error = InvalidAuth(f"Authentication error: {err}")
-                continue
         
         # If we get here, all endpoints failed
         if last_error:
             raise last_error
         else:
-            raise InvalidAuth("All authentication endpoints failed - check API URL and credentials")
+            raise CannotConnect("No authentication endpoint found - check API URL")
+
+    @property
+    def login_url(self) -> str | None:
+        """Return the login endpoint that last authenticated successfully."""
+        return self._login_url
 
     async def async_test_connection(self) -> None:
-        """Test connection to Sinum API."""
-        await self.async_authenticate()
+        """Test connection to Sinum API.
         
-        # Test získania dát
-        await self.async_get_rooms()
+        A successful login proves both reachability and credentials; room
+        data is fetched by the coordinator right after setup anyway.
+        """
+        await self.async_authenticate()
+
+    def _token_valid(self) -> bool:
+        """Return True if we hold a token that is not about to expire."""
+        return (
+            self._auth_token is not None
+            and self._token_expires_at is not None
+            and time.monotonic() < self._token_expires_at
+        )
 
     async def _ensure_authenticated(self) -> None:
         """Ensure we have a valid authentication token."""
-        import time
+        if self._token_valid():
+            return
         
-        # Check if token is expired or about to expire
-        if self._auth_token and self._token_expires_at:
-            if time.time() >= self._token_expires_at:
+        async with self._auth_lock:
+            # A concurrent caller may have re-authenticated while we waited
+            if self._token_valid():
+                return
+            
+            if self._auth_token:
                 _LOGGER.info("Token expired, re-authenticating...")
                 self._auth_token = None
                 self._token_expires_at = None
-        
-        if not self._auth_token:
+            
             await self.async_authenticate()
 
-    async def async_get_rooms(self) -> list[dict[str, Any]]:
-        """Get list of rooms with temperatures.
+    async def _async_get_json(self, url: str, what: str) -> Any:
+        """Get JSON from the API, retrying connection errors and 5xx responses."""
+        await self._ensure_authenticated()
+        return await _async_retry(
+            lambda: self._async_get_json_once(url, what),
+            _DATA_MAX_ATTEMPTS,
+            (aiohttp.ClientConnectionError, asyncio.TimeoutError, _ServerError),
+        )
+
+    async def _async_get_json_once(self, url: str, what: str) -> Any:
+        """Get JSON from the API, re-authenticating once on 401."""
+        for attempt in range(2):
+            token = self._auth_token
+            headers = self._headers
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Trying %s endpoint: %s", what, url)
+            
+            async with self._session.get(
+                url,
+                headers=headers,
+                timeout=_TIMEOUT,
+            ) as response:
+                if response.status == 401 and attempt == 0:
+                    # Token expired, re-authenticate and retry once
+                    _LOGGER.warning("Token expired (401) when getting %s, re-authenticating...", what)
+                    async with self._auth_lock:
+                        # A concurrent request may already have refreshed the token
+                        if self._auth_token == token:
+                            self._auth_token = None
+                            self._token_expires_at = None
+                            await self.async_authenticate()
+                    continue
+                if response.status != 200:
+                    error_text = await response.text()
+                    if response.status == 401:
+                        raise InvalidAuth(f"Authentication failed after retry: {response.status} - {error_text[:200]}")
+                    if response.status >= 500:
+                        raise _ServerError(f"Failed to get {what}: {response.status} - {error_text[:200]}")
+                    raise CannotConnect(f"Failed to get {what}: {response.status} - {error_text[:200]}")
+                return await response.json(loads=json_loads)
+
+    async def _async_detect_combined_devices(self) -> None:
+        """Check once whether GET /devices without a class returns all classes.
+        
+        If it does, each refresh needs one devices request instead of two.
+        The response is kept so the refresh that runs the check reuses it.
+        """
+        try:
+            devices_data = await self._async_get_json(self._devices_url, "devices")
+        except InvalidAuth:
+            raise
+        except (_ServerError, asyncio.TimeoutError) as err:
+            # Transient; use per-class requests for now and check again next time
+            _LOGGER.debug("Could not check combined devices endpoint: %s", err)
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            # Optional optimisation: never let the check fail the refresh
+            # (this includes 200 responses whose body is not valid JSON)
+            _LOGGER.debug("Combined devices endpoint not usable: %s", err)
+            self._devices_combined = False
+            return
+        
+        devices_dict = devices_data.get("data") if isinstance(devices_data, dict) else None
+        self._devices_combined = (
+            isinstance(devices_dict, dict)
+            and "sbus" in devices_dict
+            and "virtual" in devices_dict
+        )
+        _LOGGER.debug("Combined devices endpoint usable: %s", self._devices_combined)
+        if self._devices_combined:
+            self._probe_response = devices_data
+
+    async def _async_get_combined_devices(self) -> Any:
+        """Get devices of all classes, reusing the check response if there is one."""
+        devices_data, self._probe_response = self._probe_response, None
+        if devices_data is None:
+            devices_data = await self._async_get_json(self._devices_url, "devices")
+        return devices_data
+
+    async def async_get_rooms(self) -> dict[int, dict[str, Any]]:
+        """Get rooms with temperatures, keyed by room id.
         
         Sinum API structure:
         - GET /api/v1/rooms returns rooms list
         - GET /api/v1/devices?class=sbus returns temperature sensors
         - Temperature sensors have room_id and temperature field
         """
-        await self._ensure_authenticated()
-        
-        session = await self._get_session()
-        
-        headers = {
-            "Authorization": self._auth_token,  # Sinum API uses token directly, not "Bearer {token}"
-            "Content-Type": "application/json",
-        }
+        def _devices(devices_data: Any, device_class: str) -> list[dict[str, Any]]:
+            """Extract the device list of a class, treating failures as no devices."""
+            if isinstance(devices_data, BaseException):
+                _LOGGER.warning("Failed to get %s devices: %s", device_class, devices_data)
+                return []
+            devices_dict = devices_data.get("data", {}) if isinstance(devices_data, dict) else {}
+            return devices_dict.get(device_class, []) if isinstance(devices_dict, dict) else []
         
         try:
-            # Get rooms
-            rooms_url = f"{self.host}/api/v1/rooms"
-            _LOGGER.debug("Trying rooms endpoint: %s", rooms_url)
+            if self._devices_combined is None:
+                await self._async_detect_combined_devices()
             
-            async with session.get(
-                rooms_url,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as response:
-                if response.status == 401:
-                    # Token expired, re-authenticate and retry once
-                    _LOGGER.warning("Token expired (401), re-authenticating...")
-                    self._auth_token = None
-                    self._token_expires_at = None
-                    await self.async_authenticate()
-                    headers["Authorization"] = self._auth_token
-                    # Retry once
-                    async with session.get(
-                        rooms_url,
-                        headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=10),
-                    ) as retry_response:
-                        if retry_response.status != 200:
-                            error_text = await retry_response.text()
-                            raise InvalidAuth(f"Authentication failed after retry: {retry_response.status} - {error_text[:200]}")
-                        rooms_data = await retry_response.json()
-                elif response.status != 200:
-                    error_text = await response.text()
-                    raise CannotConnect(f"Failed to get rooms: {response.status} - {error_text[:200]}")
-                else:
-                    rooms_data = await response.json()
+            # Rooms, sbus devices (temperature and humidity sensors) and virtual
+            # devices (thermostats with heating/cooling state) are independent,
+            # so fetch them concurrently
+            if self._devices_combined:
+                rooms_data, sbus_data = await asyncio.gather(
+                    self._async_get_json(self._rooms_url, "rooms"),
+                    self._async_get_combined_devices(),
+                    return_exceptions=True,
+                )
+                virtual_data = sbus_data
+            else:
+                rooms_data, sbus_data, virtual_data = await asyncio.gather(
+                    self._async_get_json(self._rooms_url, "rooms"),
+                    self._async_get_json(self._sbus_devices_url, "devices"),
+                    self._async_get_json(self._virtual_devices_url, "virtual devices"),
+                    return_exceptions=True,
+                )
+            if isinstance(rooms_data, BaseException):
+                raise rooms_data
                 
             rooms_list = rooms_data.get("data", []) if isinstance(rooms_data, dict) else (rooms_data if isinstance(rooms_data, list) else [])
+            sbus_devices = _devices(sbus_data, "sbus")
+            virtual_devices = _devices(virtual_data, "virtual")
             
-            # Get sbus devices (temperature and humidity sensors)
-            devices_url = f"{self.host}/api/v1/devices?class=sbus"
-            async with session.get(
-                devices_url,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as response:
-                if response.status == 401:
-                    # Token expired, re-authenticate and retry once
-                    _LOGGER.warning("Token expired (401) when getting devices, re-authenticating...")
-                    self._auth_token = None
-                    self._token_expires_at = None
-                    await self.async_authenticate()
-                    headers["Authorization"] = self._auth_token
-                    # Retry once
-                    async with session.get(
-                        devices_url,
-                        headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=10),
-                    ) as retry_response:
-                        if retry_response.status != 200:
-                            error_text = await retry_response.text()
-                            _LOGGER.warning("Failed to get devices after retry: %s - %s", retry_response.status, error_text[:200])
-                            sbus_devices = []
-                        else:
-                            devices_data = await retry_response.json()
-                            devices_dict = devices_data.get("data", {}) if isinstance(devices_data, dict) else {}
-                            sbus_devices = devices_dict.get("sbus", []) if isinstance(devices_dict, dict) else []
-                elif response.status != 200:
-                    error_text = await response.text()
-                    _LOGGER.warning("Failed to get devices: %s - %s", response.status, error_text[:200])
-                    sbus_devices = []
-                else:
-                    devices_data = await response.json()
-                    devices_dict = devices_data.get("data", {}) if isinstance(devices_data, dict) else {}
-                    sbus_devices = devices_dict.get("sbus", []) if isinstance(devices_dict, dict) else []
-            
-            # Get virtual devices (thermostats with heating/cooling state)
-            virtual_devices_url = f"{self.host}/api/v1/devices?class=virtual"
-            async with session.get(
-                virtual_devices_url,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as response:
-                if response.status == 401:
-                    # Token expired, re-authenticate and retry once
-                    _LOGGER.warning("Token expired (401) when getting virtual devices, re-authenticating...")
-                    self._auth_token = None
-                    self._token_expires_at = None
-                    await self.async_authenticate()
-                    headers["Authorization"] = self._auth_token
-                    # Retry once
-                    async with session.get(
-                        virtual_devices_url,
-                        headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=10),
-                    ) as retry_response:
-                        if retry_response.status != 200:
-                            error_text = await retry_response.text()
-                            _LOGGER.warning("Failed to get virtual devices after retry: %s - %s", retry_response.status, error_text[:200])
-                            virtual_devices = []
-                        else:
-                            devices_data = await retry_response.json()
-                            devices_dict = devices_data.get("data", {}) if isinstance(devices_data, dict) else {}
-                            virtual_devices = devices_dict.get("virtual", []) if isinstance(devices_dict, dict) else []
-                elif response.status != 200:
-                    error_text = await response.text()
-                    _LOGGER.warning("Failed to get virtual devices: %s - %s", response.status, error_text[:200])
-                    virtual_devices = []
-                else:
-                    devices_data = await response.json()
-                    devices_dict = devices_data.get("data", {}) if isinstance(devices_data, dict) else {}
-                    virtual_devices = devices_dict.get("virtual", []) if isinstance(devices_dict, dict) else []
-            
-            # Filter temperature and humidity sensors
-            temp_sensors = [
-                d for d in sbus_devices
-                if d.get("type") == "temperature_sensor" and d.get("temperature") is not None
-            ]
-            humidity_sensors = [
-                d for d in sbus_devices
-                if d.get("type") == "humidity_sensor" and d.get("humidity") is not None
-            ]
-            
-            # Create maps by room_id
+            # Create maps by room_id (0 is a valid room id)
+            # Values are reported in tenths (e.g., 223 -> 22.3 °C, 381 -> 38.1 %).
+            # Dividing by 10 yields the closest float to the decimal value;
+            # multiplying by 0.1 would not (227 * 0.1 == 22.700000000000003).
             temp_by_room: dict[int, float] = {}
             humidity_by_room: dict[int, float] = {}
             heating_state_by_room: dict[int, bool] = {}
             cooling_state_by_room: dict[int, bool] = {}
             
-            for sensor in temp_sensors:
-                room_id = sensor.get("room_id")
-                temp_tenths = sensor.get("temperature")
-                if room_id and temp_tenths is not None:
-                    # Convert from tenths of degrees to degrees (e.g., 223 -> 22.3)
-                    temp_by_room[room_id] = temp_tenths / 10.0
-            
-            for sensor in humidity_sensors:
-                room_id = sensor.get("room_id")
-                humidity_tenths = sensor.get("humidity")
-                if room_id and humidity_tenths is not None:
-                    # Convert from tenths of percent to percent (e.g., 381 -> 38.1)
-                    humidity_by_room[room_id] = humidity_tenths / 10.0
+            # Classify sbus sensors in a single pass
+            for device in sbus_devices:
+                room_id = device.get("room_id")
+                if room_id is None:
+                    continue
+                device_type = device.get("type")
+                if device_type == "temperature_sensor":
+                    if (value := device.get("temperature")) is not None:
+                        temp_by_room[room_id] = float(value) / 10.0
+                elif device_type == "humidity_sensor":
+                    if (value := device.get("humidity")) is not None:
+                        humidity_by_room[room_id] = float(value) / 10.0
             
             for device in virtual_devices:
                 room_id = device.get("room_id")
-                if room_id:
-                    # State indicates if heating/cooling circuit is active
-                    # Mode indicates which type: "heating" or "cooling"
-                    state = device.get("state", False)
-                    mode = device.get("mode", "")
-                    
-                    # Initialize both to False
-                    heating_state_by_room[room_id] = False
-                    cooling_state_by_room[room_id] = False
-                    
-                    # If state is True, determine which mode is active
-                    if state is True:
-                        if mode == "heating":
-                            heating_state_by_room[room_id] = True
-                        elif mode == "cooling":
-                            cooling_state_by_room[room_id] = True
-                        # If state is True but mode is unclear, check is_heating/is_cooling
-                        else:
-                            is_heating = device.get("is_heating")
-                            is_cooling = device.get("is_cooling")
-                            if is_heating is True:
-                                heating_state_by_room[room_id] = True
-                            elif is_cooling is True:
-                                cooling_state_by_room[room_id] = True
+                if room_id is None:
+                    continue
+                
+                # State indicates if heating/cooling circuit is active
+                # Mode indicates which type: "heating" or "cooling";
+                # if it is unclear, fall back to is_heating/is_cooling
+                heating = cooling = False
+                if device.get("state") is True:
+                    mode = device.get("mode")
+                    if mode == "heating":
+                        heating = True
+                    elif mode == "cooling":
+                        cooling = True
+                    elif device.get("is_heating") is True:
+                        heating = True
+                    elif device.get("is_cooling") is True:
+                        cooling = True
+                heating_state_by_room[room_id] = heating
+                cooling_state_by_room[room_id] = cooling
             
-            # Combine rooms with all data
-            result = []
+            # Combine rooms with all data, keyed by room id
+            result: dict[int, dict[str, Any]] = {}
             for room in rooms_list:
                 room_id = room.get("id")
-                room_name = room.get("name", f"Room {room_id}")
-                
-                result.append({
+                result[room_id] = {
                     "id": room_id,
-                    "name": room_name,
-                    "temperature": temp_by_room.get(room_id) if room_id else None,
-                    "humidity": humidity_by_room.get(room_id) if room_id else None,
-                    "heating_on": heating_state_by_room.get(room_id, False) if room_id else False,
-                    "cooling_on": cooling_state_by_room.get(room_id, False) if room_id else False,
-                })
+                    "name": room.get("name") or f"Room {room_id}",
+                    "temperature": temp_by_room.get(room_id),
+                    "humidity": humidity_by_room.get(room_id),
+                    "heating_on": heating_state_by_room.get(room_id, False),
+                    "cooling_on": cooling_state_by_room.get(room_id, False),
+                }
             
             _LOGGER.info("Retrieved %d rooms with temperatures", len(result))
             return result
@@ -399,9 +497,3 @@ class SinumAPI:
             _LOGGER.error("Unexpected error: %s", err)
             raise CannotConnect(f"Error getting rooms: {err}") from err
 
-    async def async_close(self) -> None:
-        """Close the session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
-
@@ -6,7 +6,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -20,20 +20,17 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Sinum binary sensor platform."""
-    api = hass.data[DOMAIN][entry.entry_id]
-    coordinator = SinumDataUpdateCoordinator(hass, api)
+    coordinator: SinumDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     
-    # Fetch initial data so we have data to create entities
-    await coordinator.async_config_entry_first_refresh()
-    
-    entities = []
-    for room_id, room_data in coordinator.data.items():
-        # Add heating binary sensor for all rooms (will show False if not available)
-        entities.append(SinumHeatingBinarySensor(coordinator, room_id, room_data))
-        # Add cooling binary sensor for all rooms (will show False if not available)
-        entities.append(SinumCoolingBinarySensor(coordinator, room_id, room_data))
-    
-    async_add_entities(entities)
+    # Add heating and cooling binary sensors for all rooms (will show False if not available)
+    async_add_entities(
+        entity
+        for room_id, room_data in coordinator.data.items()
+        for entity in (
+            SinumHeatingBinarySensor(coordinator, room_id, room_data),
+            SinumCoolingBinarySensor(coordinator, room_id, room_data),
+        )
+    )
 
 
 class SinumHeatingBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -51,24 +48,19 @@ class SinumHeatingBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._room_name = room_data.get("name", f"Room {room_id}")
         self._attr_name = f"Sinum {self._room_name} Heating"
         self._attr_unique_id = f"{DOMAIN}_{room_id}_heating"
-        self._attr_device_class = BinarySensorDeviceClass.HEAT
-
-    @property
-    def is_on(self) -> bool:
-        """Return the state of the sensor."""
-        if self.coordinator.data and self._room_id in self.coordinator.data:
-            room_data = self.coordinator.data[self._room_id]
-            heating_on = room_data.get("heating_on", False)
-            return bool(heating_on)
-        return False
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return the state attributes."""
-        return {
-            ATTR_ROOM_ID: self._room_id,
+        self._attr_extra_state_attributes = {
+            ATTR_ROOM_ID: room_id,
             ATTR_ROOM_NAME: self._room_name,
         }
+        self._attr_device_class = BinarySensorDeviceClass.HEAT
+        self._attr_is_on = bool(room_data.get("heating_on", False))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the state from the latest coordinator data."""
+        room_data = self.coordinator.data.get(self._room_id) or {}
+        self._attr_is_on = bool(room_data.get("heating_on", False))
+        super()._handle_coordinator_update()
 
 
 class SinumCoolingBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -86,22 +78,16 @@ class SinumCoolingBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._room_name = room_data.get("name", f"Room {room_id}")
         self._attr_name = f"Sinum {self._room_name} Cooling"
         self._attr_unique_id = f"{DOMAIN}_{room_id}_cooling"
-        self._attr_device_class = BinarySensorDeviceClass.COLD
-
-    @property
-    def is_on(self) -> bool:
-        """Return the state of the sensor."""
-        if self.coordinator.data and self._room_id in self.coordinator.data:
-            room_data = self.coordinator.data[self._room_id]
-            cooling_on = room_data.get("cooling_on", False)
-            return bool(cooling_on)
-        return False
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return the state attributes."""
-        return {
-            ATTR_ROOM_ID: self._room_id,
+        self._attr_extra_state_attributes = {
+            ATTR_ROOM_ID: room_id,
             ATTR_ROOM_NAME: self._room_name,
         }
+        self._attr_device_class = BinarySensorDeviceClass.COLD
+        self._attr_is_on = bool(room_data.get("cooling_on", False))
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the state from the latest coordinator data."""
+        room_data = self.coordinator.data.get(self._room_id) or {}
+        self._attr_is_on = bool(room_data.get("cooling_on", False))
+        super()._handle_coordinator_update()
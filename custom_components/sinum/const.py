@@ -5,6 +5,8 @@ DOMAIN: Final = "sinum"
 DEFAULT_NAME: Final = "Sinum"
 DEFAULT_SCAN_INTERVAL: Final = 60  # seconds
 
+CONF_LOGIN_URL: Final = "login_url"
+
 ATTR_ROOM_NAME: Final = "room_name"
 ATTR_ROOM_ID: Final = "room_id"
 ATTR_HEATING_ON: Final = "heating_on"
@@ -5,10 +5,12 @@ import logging
 from datetime import timedelta
 
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import SinumAPI
 from .const import DOMAIN
+from .exceptions import InvalidAuth
 
 _LOGGER = logging.getLogger(__name__)
 SCAN_INTERVAL = timedelta(seconds=60)
@@ -30,9 +32,10 @@ class SinumDataUpdateCoordinator(DataUpdateCoordinator):
     async def _async_update_data(self) -> dict:
         """Update data via library."""
         try:
-            rooms = await self.api.async_get_rooms()
-            # Convert rooms list to dict for easier access
-            return {room["id"]: room for room in rooms}
+            return await self.api.async_get_rooms()
+        except InvalidAuth as err:
+            # Credentials stopped working; let Home Assistant start re-authentication
+            raise ConfigEntryAuthFailed(f"Invalid Sinum credentials: {err}") from err
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
@@ -8,7 +8,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature, PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -22,11 +22,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Sinum sensor platform."""
-    api = hass.data[DOMAIN][entry.entry_id]
-    coordinator = SinumDataUpdateCoordinator(hass, api)
-    
-    # Fetch initial data so we have data to create entities
-    await coordinator.async_config_entry_first_refresh()
+    coordinator: SinumDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     
     entities = []
     for room_id, room_data in coordinator.data.items():
@@ -55,30 +51,22 @@ class SinumTemperatureSensor(CoordinatorEntity, SensorEntity):
         self._room_name = room_data.get("name", f"Room {room_id}")
         self._attr_name = f"Sinum {self._room_name}"
         self._attr_unique_id = f"{DOMAIN}_{room_id}_temperature"
+        self._attr_extra_state_attributes = {
+            ATTR_ROOM_ID: room_id,
+            ATTR_ROOM_NAME: self._room_name,
+        }
         self._attr_device_class = SensorDeviceClass.TEMPERATURE
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_suggested_display_precision = 1
+        self._attr_native_value = room_data.get("temperature")
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        if self.coordinator.data and self._room_id in self.coordinator.data:
-            room_data = self.coordinator.data[self._room_id]
-            temperature = room_data.get("temperature")
-            if temperature is not None:
-                try:
-                    return float(temperature)
-                except (ValueError, TypeError):
-                    return None
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return the state attributes."""
-        return {
-            ATTR_ROOM_ID: self._room_id,
-            ATTR_ROOM_NAME: self._room_name,
-        }
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the state from the latest coordinator data."""
+        room_data = self.coordinator.data.get(self._room_id) or {}
+        self._attr_native_value = room_data.get("temperature")
+        super()._handle_coordinator_update()
 
 
 class SinumHumiditySensor(CoordinatorEntity, SensorEntity):
@@ -96,28 +84,19 @@ class SinumHumiditySensor(CoordinatorEntity, SensorEntity):
         self._room_name = room_data.get("name", f"Room {room_id}")
         self._attr_name = f"Sinum {self._room_name} Humidity"
         self._attr_unique_id = f"{DOMAIN}_{room_id}_humidity"
+        self._attr_extra_state_attributes = {
+            ATTR_ROOM_ID: room_id,
+            ATTR_ROOM_NAME: self._room_name,
+        }
         self._attr_device_class = SensorDeviceClass.HUMIDITY
         self._attr_native_unit_of_measurement = PERCENTAGE
         self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_suggested_display_precision = 1
+        self._attr_native_value = room_data.get("humidity")
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        if self.coordinator.data and self._room_id in self.coordinator.data:
-            room_data = self.coordinator.data[self._room_id]
-            humidity = room_data.get("humidity")
-            if humidity is not None:
-                try:
-                    return float(humidity)
-                except (ValueError, TypeError):
-                    return None
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return the state attributes."""
-        return {
-            ATTR_ROOM_ID: self._room_id,
-            ATTR_ROOM_NAME: self._room_name,
-        }
-
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the state from the latest coordinator data."""
+        room_data = self.coordinator.data.get(self._room_id) or {}
+        self._attr_native_value = room_data.get("humidity")
+        super()._handle_coordinator_update()